@@ -1,13 +1,15 @@
 import json
+import shlex
 import subprocess
 import time
 from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 import typer
 
 from ..domain import PostgresConfig
+from ..timing import recorder
 
 app = typer.Typer(
     help="PostgreSQL Development Environment Manager",
@@ -24,17 +26,48 @@ state = {"pg_instance": DEFAULT_INSTANCE}
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     pg_instance: str = typer.Option(
         None,
         "--pg-instance",
         "-pgi",
         envvar="PG_INSTANCE",
         help="Select the PostgreSQL instance to operate on",
-    )
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print a summary of time spent in external commands, waits and config loads",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        dir_okay=False,
+        help="Write a Chrome trace-event JSON of the recorded timings to FILE",
+    ),
+    timings_history: bool = typer.Option(
+        False,
+        "--timings-history",
+        help="Append the recorded timings to the instance's history file",
+    ),
 ):
     if pg_instance:
         state["pg_instance"] = pg_instance
 
+    recorder.reset(enabled=timings or trace is not None or timings_history)
+    subcommand = ctx.command.get_command(ctx, ctx.invoked_subcommand) if ctx.invoked_subcommand else None
+    if recorder.enabled and subcommand is not None:
+        # The callback runs before the subcommand parses its arguments, so only the
+        # subcommand's own invoke tells us it actually ran (not --help or a usage error)
+        invoke_subcommand = subcommand.invoke
+
+        def timed_invoke(sub_ctx: typer.Context):
+            with recorder.span(f"pgctl {sub_ctx.info_name}", "cli", instance=get_instance_name()):
+                return invoke_subcommand(sub_ctx)
+
+        subcommand.invoke = timed_invoke  # type: ignore[method-assign]
+        ctx.call_on_close(lambda: report_timings(ctx.invoked_subcommand or "", timings, trace, timings_history))
+
 def get_instance_name() -> str:
     return state["pg_instance"]
 
@@ -49,6 +82,10 @@ def get_config_file_path() -> Path:
     """Return the configuration file path for the current instance"""
     return get_build_root() / "config" / "postgres-config.json"
 
+def get_timings_history_path() -> Path:
+    """Return the timings history file path for the current instance"""
+    return get_build_root() / "timings" / "history.jsonl"
+
 def get_default_config() -> PostgresConfig:
     """Default PostgreSQL configuration"""
     instance = get_instance_name()
@@ -63,17 +100,21 @@ def get_config() -> PostgresConfig:
 def load_config() -> PostgresConfig:
     """Load PostgreSQL configuration from JSON file"""
     config_file = get_config_file_path()
-    if not config_file.exists():
-        return get_default_config()
-
-    try:
-        with open(config_file) as f:
-            data = json.load(f)
-            return PostgresConfig(**data)
-    except (json.JSONDecodeError, TypeError, ValueError) as e:
-        # Fallback to default if config is invalid, but maybe should raise in production
-        print(f"⚠️ Warning: Failed to load config from {config_file}: {e}. Using defaults.")
-        return get_default_config()
+    with recorder.span("load config", "config", path=str(config_file)) as span:
+        if not config_file.exists():
+            span["exists"] = False
+            return get_default_config()
+
+        span["exists"] = True
+        try:
+            with open(config_file) as f:
+                data = json.load(f)
+                return PostgresConfig(**data)
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            # Fallback to default if config is invalid, but maybe should raise in production
+            span["fallback"] = type(e).__name__
+            print(f"⚠️ Warning: Failed to load config from {config_file}: {e}. Using defaults.")
+            return get_default_config()
 
 def run_shell_command(
     cmd: list[str], capture_output: bool = True, use_build_root: bool = False
@@ -86,21 +127,59 @@ def run_shell_command(
     if use_build_root:
         cwd.mkdir(parents=True, exist_ok=True)
 
-    try:
-        if capture_output:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=cwd,
-            )
-            return True, result.stdout
-
-        subprocess.run(cmd, check=True, cwd=cwd)
-        return True, ""
-    except subprocess.CalledProcessError as e:
-        return False, e.stderr if capture_output else str(e)
+    with recorder.span(shlex.join(cmd), "command", argv=cmd) as span:
+        try:
+            if capture_output:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    cwd=cwd,
+                )
+                span.update(exit_code=result.returncode, **_output_sizes(result.stdout, result.stderr))
+                return True, result.stdout
+
+            subprocess.run(cmd, check=True, cwd=cwd)
+            span["exit_code"] = 0
+            return True, ""
+        except subprocess.CalledProcessError as e:
+            span["exit_code"] = e.returncode
+            if capture_output:
+                span.update(_output_sizes(e.stdout, e.stderr))
+            return False, e.stderr if capture_output else str(e)
+
+def _output_sizes(stdout: Optional[str], stderr: Optional[str]) -> dict:
+    """Byte sizes of captured command output"""
+    return {
+        "stdout_bytes": len((stdout or "").encode()),
+        "stderr_bytes": len((stderr or "").encode()),
+    }
+
+def report_timings(command: str, timings: bool, trace: Optional[Path], history: bool) -> None:
+    """Emit the recorded timings as requested by the global options"""
+    if not any(span.category == "cli" for span in recorder.spans):
+        return
+
+    if timings:
+        print("\n⏱️  Timings")
+        print(recorder.summary())
+    if trace is not None:
+        try:
+            recorder.write_chrome_trace(trace)
+            print(f"✓ Trace written to {trace}")
+        except OSError as e:
+            print(f"⚠️ Warning: Failed to write trace to {trace}: {e}")
+    if history:
+        history_file = get_timings_history_path()
+        # Read the image without recording, so summary, trace and history share one set of spans
+        with recorder.paused():
+            image = get_config().image
+        try:
+            recorder.append_history(history_file, instance=get_instance_name(), command=command, image=image)
+            print(f"✓ Timings appended to {history_file}")
+        except OSError as e:
+            print(f"⚠️ Warning: Failed to append timings to {history_file}: {e}")
 
 def show_connection_info():
     """Display connection information"""
@@ -148,18 +227,24 @@ def handle_successful_start():
     print("\n⏳ Waiting for PostgreSQL to be healthy...")
 
     pg_config = get_config()
-    for i in range(30):
-        time.sleep(1)
-        success, _ = run_shell_command([
-            "docker", "exec", pg_config.container_name,
-            "pg_isready", "-U", pg_config.user
-        ])
-        if success:
-            print("✅ PostgreSQL is ready!")
-            show_connection_info()
-            show_extensions()
-            return
-        print(".", end="", flush=True)
+    with recorder.span("wait for pg_isready", "wait", ready=False) as span:
+        for attempt in range(1, 31):
+            time.sleep(1)
+            success, _ = run_shell_command([
+                "docker", "exec", pg_config.container_name,
+                "pg_isready", "-U", pg_config.user
+            ])
+            span["attempts"] = attempt
+            if success:
+                span["ready"] = True
+                break
+            print(".", end="", flush=True)
+
+    if span["ready"]:
+        print("✅ PostgreSQL is ready!")
+        show_connection_info()
+        show_extensions()
+        return
 
     print("\n⚠️  PostgreSQL may still be starting. Check with: pgctl logs")
 
@@ -1,5 +1,6 @@
 import time
 
+from ..timing import recorder
 from . import app, get_instance_name, handle_successful_start, run_shell_command
 
 
@@ -16,7 +17,8 @@ def restart():
         return
 
     print("✓ PostgreSQL stopped")
-    time.sleep(2)
+    with recorder.span("settle after stop", "wait", seconds=2):
+        time.sleep(2)
 
     # Start the container
     start_success, start_output = run_shell_command(["docker-compose", "up", "-d"], use_build_root=True)
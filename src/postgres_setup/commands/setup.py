@@ -5,6 +5,7 @@ from typing import Annotated, Optional
 import typer
 
 from ..domain import PostgresConfig
+from ..timing import recorder
 from . import PROJECT_ROOT, app, get_build_root, get_config, get_config_file_path
 
 
@@ -118,9 +119,10 @@ def setup(
     if config_path:
         print(f"📄 Seeding configuration from {config_path}")
         try:
-            with open(config_path) as f:
-                data = json.load(f)
-                config = PostgresConfig(**data)
+            with recorder.span("load seed config", "config", path=str(config_path)):
+                with open(config_path) as f:
+                    data = json.load(f)
+                    config = PostgresConfig(**data)
         except (json.JSONDecodeError, TypeError, ValueError) as e:
             print(f"❌ Error parsing config file: {e}")
             raise typer.Exit(code=1)
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+# Outcome details kept per span in the history file
+HISTORY_SPAN_ARGS = ("exit_code", "attempts", "ready", "error")
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float
+    duration: float
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Recorder:
+    """Collects timing spans for external commands, waits and config loads"""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.spans: list[Span] = []
+        self.origin = time.perf_counter()
+
+    def reset(self, enabled: bool) -> None:
+        """Discard recorded spans and restart the clock"""
+        self.enabled = enabled
+        self.spans = []
+        self.origin = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Seconds since the recorder was last reset"""
+        return time.perf_counter() - self.origin
+
+    def record(self, name: str, category: str, start: float, duration: float, **args: Any) -> None:
+        """Record a finished span; start is relative to the recorder origin"""
+        if self.enabled:
+            self.spans.append(Span(name, category, start, duration, args))
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """Suspend recording for work done only to report on the run"""
+        enabled, self.enabled = self.enabled, False
+        try:
+            yield
+        finally:
+            self.enabled = enabled
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; callers may add details to the yielded args"""
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as e:
+            args.setdefault("error", type(e).__name__)
+            raise
+        finally:
+            self.record(name, category, start - self.origin, time.perf_counter() - start, **args)
+
+    def succeeded(self) -> bool:
+        """True unless a command failed, a wait gave up or a span raised
+
+        Commands polled inside a wait span are expected to fail until the wait
+        is over, so their exit codes are judged by the wait's ``ready`` instead.
+        """
+        waits = [(span.start, span.start + span.duration) for span in self.spans if span.category == "wait"]
+
+        def failed(span: Span) -> bool:
+            polled = any(start <= span.start < end for start, end in waits)
+            return (
+                (span.args.get("exit_code", 0) != 0 and not polled)
+                or span.args.get("ready") is False
+                or "error" in span.args
+            )
+
+        return not any(failed(span) for span in self.spans)
+
+    def summary(self) -> str:
+        """Render spans aggregated by category and name as a text table"""
+        totals: dict[tuple[str, str], list[float]] = {}
+        for span in self.spans:
+            totals.setdefault((span.category, span.name), []).append(span.duration)
+
+        rows = sorted(totals.items(), key=lambda item: sum(item[1]), reverse=True)
+        lines = [f"{'Category':<10} {'Count':>5} {'Total (s)':>10} {'Max (s)':>9}  Name"]
+        for (category, name), durations in rows:
+            label = name if len(name) <= 60 else name[:57] + "..."
+            lines.append(f"{category:<10} {len(durations):>5} {sum(durations):>10.3f} {max(durations):>9.3f}  {label}")
+        lines.append(f"Total wall time: {self.elapsed():.3f}s")
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> dict:
+        """Convert spans to the Chrome trace-event format (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round(span.start * 1_000_000),
+                "dur": round(span.duration * 1_000_000),
+                "pid": pid,
+                "tid": 1,
+                "args": span.args,
+            }
+            for span in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the Chrome trace JSON to path"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f, indent=2)
+
+    def append_history(self, path: Path, **metadata: Any) -> None:
+        """Append one JSON line describing this run to a history file"""
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            **metadata,
+            "total_seconds": round(self.elapsed(), 6),
+            "success": self.succeeded(),
+            "spans": [
+                {
+                    "name": span.name,
+                    "category": span.category,
+                    "duration": round(span.duration, 6),
+                    **{key: span.args[key] for key in HISTORY_SPAN_ARGS if key in span.args},
+                }
+                for span in self.spans
+            ],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+# Shared recorder for the current CLI invocation
+recorder = Recorder()
@@ -0,0 +1,10 @@
+import pytest
+
+from postgres_setup.timing import recorder
+
+
+@pytest.fixture
+def enabled_recorder():
+    recorder.reset(enabled=True)
+    yield recorder
+    recorder.reset(enabled=False)
@@ -112,3 +112,31 @@ def test_setup_command(mock_config_exists):
          patch("builtins.open", mock_open(read_data=config_data)):
         setup()
         # Verification of file writes could be more detailed, but this checks it runs
+
+def _wait_span(rec):
+    return next(span for span in rec.spans if span.category == "wait")
+
+def test_start_waits_until_ready(mock_run_command, enabled_recorder):
+    # up, three failed pg_isready, a successful one, then show_extensions
+    mock_run_command.side_effect = [(True, "")] + [(False, "")] * 3 + [(True, ""), (True, "")]
+    with patch("time.sleep", return_value=None), \
+         patch("builtins.print") as mock_print:
+        start()
+
+    printed_text = "".join(call.args[0] for call in mock_print.call_args_list if call.args)
+    assert "..." in printed_text
+    assert "PostgreSQL is ready!" in printed_text
+    assert "may still be starting" not in printed_text
+    assert _wait_span(enabled_recorder).args == {"ready": True, "attempts": 4}
+
+def test_start_gives_up_waiting(mock_run_command, enabled_recorder):
+    mock_run_command.side_effect = [(True, "")] + [(False, "")] * 30
+    with patch("time.sleep", return_value=None), \
+         patch("builtins.print") as mock_print:
+        start()
+
+    printed_text = "".join(call.args[0] for call in mock_print.call_args_list if call.args)
+    assert "PostgreSQL is ready!" not in printed_text
+    assert "may still be starting" in printed_text
+    assert mock_run_command.call_count == 31
+    assert _wait_span(enabled_recorder).args == {"ready": False, "attempts": 30}
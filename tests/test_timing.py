@@ -0,0 +1,204 @@
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from postgres_setup.commands import DEFAULT_INSTANCE, app, get_config, report_timings, run_shell_command
+from postgres_setup.timing import Recorder, recorder
+
+
+def test_recorder_disabled_records_nothing():
+    rec = Recorder()
+    with rec.span("noop", "wait"):
+        pass
+    assert rec.spans == []
+
+def test_recorder_span_records_args_and_errors():
+    rec = Recorder()
+    rec.reset(enabled=True)
+    with rec.span("ok", "command", argv=["true"]) as span:
+        span["exit_code"] = 0
+    with pytest.raises(RuntimeError):
+        with rec.span("fails", "command"):
+            raise RuntimeError("boom")
+
+    assert [s.name for s in rec.spans] == ["ok", "fails"]
+    assert rec.spans[0].args == {"argv": ["true"], "exit_code": 0}
+    assert rec.spans[1].args["error"] == "RuntimeError"
+
+def test_recorder_chrome_trace_and_summary():
+    rec = Recorder()
+    rec.reset(enabled=True)
+    rec.record("docker-compose up -d", "command", 0.5, 1.25, exit_code=0)
+    rec.record("docker-compose up -d", "command", 2.0, 0.75, exit_code=0)
+
+    trace = rec.to_chrome_trace()
+    event = trace["traceEvents"][0]
+    assert event["ph"] == "X"
+    assert event["ts"] == 500_000
+    assert event["dur"] == 1_250_000
+    assert event["args"] == {"exit_code": 0}
+
+    summary = rec.summary()
+    assert "docker-compose up -d" in summary
+    assert "2.000" in summary
+
+def test_recorder_append_history(tmp_path):
+    rec = Recorder()
+    rec.reset(enabled=True)
+    rec.record("wait for pg_isready", "wait", 0.0, 3.0, attempts=3, ready=True)
+    history_file = tmp_path / "timings" / "history.jsonl"
+
+    rec.append_history(history_file, instance="default", image="postgres:16")
+    rec.record("docker-compose up -d", "command", 3.0, 0.5, argv=["docker-compose", "up", "-d"], exit_code=1)
+    rec.append_history(history_file, instance="default", image="postgres:17")
+
+    entries = [json.loads(line) for line in history_file.read_text().splitlines()]
+    assert [e["image"] for e in entries] == ["postgres:16", "postgres:17"]
+    assert [e["success"] for e in entries] == [True, False]
+    assert entries[0]["spans"] == [
+        {"name": "wait for pg_isready", "category": "wait", "duration": 3.0, "attempts": 3, "ready": True}
+    ]
+    assert entries[1]["spans"][1] == {
+        "name": "docker-compose up -d", "category": "command", "duration": 0.5, "exit_code": 1
+    }
+
+def test_recorder_succeeded():
+    rec = Recorder()
+    rec.reset(enabled=True)
+    rec.record("load config", "config", 0.0, 0.1, fallback="JSONDecodeError")
+    rec.record("docker-compose up -d", "command", 0.1, 1.0, exit_code=0)
+    assert rec.succeeded()
+
+    rec.record("pg_isready", "command", 1.2, 0.1, exit_code=2)
+    rec.record("wait for pg_isready", "wait", 1.1, 3.0, attempts=2, ready=True)
+    assert rec.succeeded()
+
+    rec.record("wait for pg_isready", "wait", 4.1, 30.0, attempts=30, ready=False)
+    assert not rec.succeeded()
+
+def test_run_shell_command_records_span(enabled_recorder):
+    completed = subprocess.CompletedProcess(["docker", "ps"], 0, stdout="abc", stderr="")
+    with patch("subprocess.run", return_value=completed):
+        run_shell_command(["docker", "ps"])
+
+    error = subprocess.CalledProcessError(2, ["docker", "ps"], output="", stderr="oops")
+    with patch("subprocess.run", side_effect=error):
+        run_shell_command(["docker", "ps"])
+
+    ok, failed = enabled_recorder.spans
+    assert ok.name == "docker ps"
+    assert ok.args == {"argv": ["docker", "ps"], "exit_code": 0, "stdout_bytes": 3, "stderr_bytes": 0}
+    assert failed.args["exit_code"] == 2
+    assert failed.args["stderr_bytes"] == 4
+
+def test_report_timings_warns_on_unwritable_paths(enabled_recorder, tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+    enabled_recorder.record("pgctl start", "cli", 0.0, 1.0)
+    with patch("postgres_setup.commands.PROJECT_ROOT", blocker), \
+         patch("builtins.print") as mock_print:
+        report_timings("start", False, blocker / "trace.json", True)
+
+    printed_text = "\n".join(call.args[0] for call in mock_print.call_args_list if call.args)
+    assert "⚠️ Warning: Failed to write trace" in printed_text
+    assert "⚠️ Warning: Failed to append timings" in printed_text
+
+def test_cli_start_with_timing_options(tmp_path):
+    trace_file = tmp_path / "start-trace.json"
+    completed = subprocess.CompletedProcess([], 0, stdout="ok", stderr="")
+    get_config.cache_clear()
+    try:
+        with patch("postgres_setup.commands.PROJECT_ROOT", tmp_path), \
+             patch.dict("postgres_setup.commands.state", {"pg_instance": DEFAULT_INSTANCE}), \
+             patch("subprocess.run", return_value=completed), \
+             patch("time.sleep", return_value=None):
+            result = CliRunner().invoke(
+                app, ["--timings", "--trace", str(trace_file), "--timings-history", "start"]
+            )
+    finally:
+        get_config.cache_clear()
+        recorder.reset(enabled=False)
+
+    assert result.exit_code == 0, result.output
+    assert "Timings" in result.output
+    assert "docker-compose up -d" in result.output
+    assert "Total wall time" in result.output
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    names = {event["name"] for event in events}
+    assert {"pgctl start", "docker-compose up -d", "wait for pg_isready", "load config"} <= names
+    assert all(event["ph"] == "X" for event in events)
+
+    history_file = tmp_path / "build" / "DEFAULT" / "timings" / "history.jsonl"
+    entry = json.loads(history_file.read_text().splitlines()[-1])
+    assert entry["command"] == "start"
+    assert entry["image"] == "postgres:16"
+    assert entry["success"] is True
+
+def test_cli_help_does_not_report_timings(tmp_path):
+    get_config.cache_clear()
+    try:
+        with patch("postgres_setup.commands.PROJECT_ROOT", tmp_path), \
+             patch.dict("postgres_setup.commands.state", {"pg_instance": DEFAULT_INSTANCE}), \
+             patch("subprocess.run") as mock_run:
+            result = CliRunner().invoke(app, ["--timings", "--timings-history", "start", "--help"])
+    finally:
+        get_config.cache_clear()
+        recorder.reset(enabled=False)
+
+    assert result.exit_code == 0, result.output
+    assert "Start PostgreSQL container" in result.output
+    assert "Timings" not in result.output
+    mock_run.assert_not_called()
+    assert not (tmp_path / "build" / "DEFAULT" / "timings" / "history.jsonl").exists()
+
+def test_cli_history_and_trace_share_spans(tmp_path):
+    trace_file = tmp_path / "stop-trace.json"
+    completed = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+    get_config.cache_clear()
+    try:
+        with patch("postgres_setup.commands.PROJECT_ROOT", tmp_path), \
+             patch.dict("postgres_setup.commands.state", {"pg_instance": DEFAULT_INSTANCE}), \
+             patch("subprocess.run", return_value=completed):
+            result = CliRunner().invoke(app, ["--trace", str(trace_file), "--timings-history", "stop"])
+    finally:
+        get_config.cache_clear()
+        recorder.reset(enabled=False)
+
+    assert result.exit_code == 0, result.output
+    trace_names = [event["name"] for event in json.loads(trace_file.read_text())["traceEvents"]]
+    history_file = tmp_path / "build" / "DEFAULT" / "timings" / "history.jsonl"
+    entry = json.loads(history_file.read_text().splitlines()[-1])
+    assert [span["name"] for span in entry["spans"]] == trace_names == ["docker-compose down", "pgctl stop"]
+    assert entry["image"] == "postgres:16"
+
+def test_cli_start_with_pg_isready_retries_succeeds(tmp_path):
+    def run(cmd, **kwargs):
+        if "pg_isready" in cmd and run.retries:
+            run.retries -= 1
+            raise subprocess.CalledProcessError(2, cmd, output="", stderr="no response")
+        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+    run.retries = 3
+
+    get_config.cache_clear()
+    try:
+        with patch("postgres_setup.commands.PROJECT_ROOT", tmp_path), \
+             patch.dict("postgres_setup.commands.state", {"pg_instance": DEFAULT_INSTANCE}), \
+             patch("subprocess.run", side_effect=run), \
+             patch("time.sleep", return_value=None):
+            result = CliRunner().invoke(app, ["--timings-history", "start"])
+    finally:
+        get_config.cache_clear()
+        recorder.reset(enabled=False)
+
+    assert result.exit_code == 0, result.output
+    assert "PostgreSQL is ready!" in result.output
+    history_file = tmp_path / "build" / "DEFAULT" / "timings" / "history.jsonl"
+    entry = json.loads(history_file.read_text().splitlines()[-1])
+    polls = [span for span in entry["spans"] if "pg_isready" in span["name"] and span["category"] == "command"]
+    assert [span["exit_code"] for span in polls] == [2, 2, 2, 0]
+    assert next(span for span in entry["spans"] if span["category"] == "wait")["attempts"] == 4
+    assert entry["success"] is True